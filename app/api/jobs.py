@@ -15,21 +15,33 @@ All AI-related work is delegated to background workers.
 """
 
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict
 
+import orjson
 from fastapi import APIRouter, HTTPException, status
 
+from app.cache.redis import get_redis
 from app.models.schemas import (
     ContentAnalysisRequest,
     JobCreateResponse,
     JobStatusResponse,
 )
-from app.storage.jobs_repository import JobsRepository
+from app.storage.jobs_repository import JobsRepository, status_cache_key
 from app.queue.publisher import publish_job
 
 router = APIRouter(prefix="/v1/content-analysis", tags=["Content Analysis"])
 
+# Frontends poll job status at ~1Hz per client; a short cache absorbs
+# repeat polls between state changes. Terminal statuses never change
+# again, so they can be cached much longer. Every repository write
+# invalidates the entry, so the short TTL only bounds staleness if an
+# invalidation is lost.
+STATUS_CACHE_TTL = 1
+TERMINAL_STATUS_CACHE_TTL = 60
+
+TERMINAL_STATUSES = {"COMPLETED", "COMPLETED_WITH_WARNINGS", "FAILED"}
+
 
 @router.post(
     "/jobs",
@@ -53,7 +65,7 @@ async def create_content_analysis_job(
     """
 
     job_id = f"job_{uuid4().hex}"
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
 
     job_record = {
         "job_id": job_id,
@@ -61,7 +73,7 @@ async def create_content_analysis_job(
         "creator_id": payload.creator_id,
         "status": "PENDING",
         "created_at": now,
-        "payload": payload.model_dump(),
+        "payload": payload.model_dump(mode="json"),
         "updated_at": now,
         "results": None,
         "errors": [],
@@ -72,7 +84,7 @@ async def create_content_analysis_job(
     try:
         await publish_job(
             job_id=job_id,
-            payload=payload.model_dump(),
+            payload=payload.model_dump(mode="json"),
         )
     except Exception as exc:
         # Queue failure should surface immediately
@@ -80,6 +92,7 @@ async def create_content_analysis_job(
             job_id,
             status="FAILED",
             error=str(exc),
+            now=now,
         )
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -111,6 +124,13 @@ async def get_content_analysis_job(job_id: str) -> JobStatusResponse:
     or completed with warnings.
     """
 
+    redis = get_redis()
+    cache_key = status_cache_key(job_id)
+
+    cached = await redis.get(cache_key)
+    if cached is not None:
+        return JobStatusResponse(**orjson.loads(cached))
+
     job = await JobsRepository.get(job_id)
 
     if not job:
@@ -119,7 +139,7 @@ async def get_content_analysis_job(job_id: str) -> JobStatusResponse:
             detail="Job not found",
         )
 
-    return JobStatusResponse(
+    response = JobStatusResponse(
         job_id=job["job_id"],
         status=job["status"],
         results=job.get("results"),
@@ -127,3 +147,16 @@ async def get_content_analysis_job(job_id: str) -> JobStatusResponse:
         created_at=job["created_at"],
         updated_at=job["updated_at"],
     )
+
+    ttl = (
+        TERMINAL_STATUS_CACHE_TTL
+        if response.status in TERMINAL_STATUSES
+        else STATUS_CACHE_TTL
+    )
+    await redis.set(
+        cache_key,
+        orjson.dumps(response.model_dump()),
+        ex=ttl,
+    )
+
+    return response
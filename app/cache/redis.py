@@ -0,0 +1,40 @@
+"""
+redis.py
+
+Process-wide async Redis connection.
+
+Used for response caching and other cross-process shared state.
+The connection is created lazily and shared for the lifetime of the
+process; callers must treat cache failures as soft errors.
+"""
+
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.config import REDIS_URL
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    Return the shared async Redis connection, creating it on first use.
+    """
+    global _redis
+
+    if _redis is None:
+        _redis = aioredis.from_url(REDIS_URL)
+
+    return _redis
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis connection on application shutdown.
+    """
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+    _redis = None
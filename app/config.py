@@ -50,6 +50,12 @@ CLAUDE_API_URL = "https://api.anthropic.com/v1/messages"
 
 DATABASE_URL = _required("DATABASE_URL")
 
+# -------------------------------------------------------------------
+# Redis
+# -------------------------------------------------------------------
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
 # -------------------------------------------------------------------
 # Queue
 # -------------------------------------------------------------------
@@ -17,7 +17,7 @@ Design principles:
 from datetime import datetime
 from typing import List, Dict, Optional, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 # -------------------------------------------------------------------
@@ -74,6 +74,10 @@ class CategoryResult(BaseModel):
         One of: Safe, Warning, Unsafe
     """
 
+    # Constructed thousands of times per job and never mutated after
+    # creation; frozen instances are safely shareable and hashable.
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     score: Optional[float] = Field(
         None,
         ge=0,
@@ -153,3 +157,15 @@ class JobStatusResponse(BaseModel):
 
     created_at: datetime
     updated_at: datetime
+
+
+# -------------------------------------------------------------------
+# Eager schema builds
+# -------------------------------------------------------------------
+#
+# Rebuild the hot worker-path models at import time so the first job
+# does not pay cold-start validator compilation.
+
+CategoryResult.model_rebuild()
+MediaModerationResult.model_rebuild()
+VisualSafetyReport.model_rebuild()
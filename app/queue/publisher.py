@@ -3,13 +3,20 @@ publisher.py
 
 Async job publisher.
 
-In production, this would publish messages to SQS, RabbitMQ, or Kafka.
+Jobs are published to a Redis Stream consumed by dedicated worker
+processes (see app/queue/worker.py), so heavy Sightengine/Claude work
+never runs on the event loop serving HTTP. The in-process path is
+kept for local development only.
 """
 
 from typing import Dict
 import asyncio
+
+import orjson
+
+from app.cache.redis import get_redis
 from app.queue.consumer import consume
-from app.config import ENVIRONMENT
+from app.config import ENVIRONMENT, QUEUE_NAME
 
 import logging
 logger = logging.getLogger(__name__)
@@ -18,12 +25,7 @@ logger = logging.getLogger(__name__)
 async def publish_job(job_id: str, payload: Dict) -> None:
     """
     Publish a job to the background processing queue.
-
-    This example simulates async queue behavior.
     """
-    # simulate network latency
-    await asyncio.sleep(0.01)
-
     if ENVIRONMENT == "local":
         # Local-only: run worker in the same process
         logger.info("Local mode: executing job %s in-process", job_id)
@@ -36,9 +38,13 @@ async def publish_job(job_id: str, payload: Dict) -> None:
 
         asyncio.create_task(safe_consume(job_id))
     else:
-        # in real life: 
-        # publish to real queue
-        # send message to SQS / broker
-        pass
+        redis = get_redis()
+        await redis.xadd(
+            QUEUE_NAME,
+            {
+                "job_id": job_id,
+                "payload": orjson.dumps(payload),
+            },
+        )
 
     return
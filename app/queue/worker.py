@@ -0,0 +1,112 @@
+"""
+worker.py
+
+Standalone queue worker process.
+
+Reads jobs from the Redis Stream written by the publisher using a
+consumer group, so any number of worker processes can be run in
+parallel and each job is delivered to exactly one of them:
+
+    python -m app.queue.worker
+
+Scaling workers is independent of scaling the API: moderation load
+never competes with the event loop serving HTTP.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+
+import redis.exceptions
+import uvloop
+
+from app.cache.redis import get_redis, close_redis
+from app.config import QUEUE_NAME
+from app.queue.consumer import consume
+from app.services.claude_summary_service import close_claude_service
+from app.services.sightengine_client import close_http_client
+
+logger = logging.getLogger(__name__)
+
+CONSUMER_GROUP = "content-analysis-workers"
+
+# Unique per worker process, so Redis can track pending deliveries.
+CONSUMER_NAME = f"{socket.gethostname()}-{os.getpid()}"
+
+# How long a single XREADGROUP call blocks waiting for messages.
+BLOCK_MS = 5000
+
+# Messages fetched per read.
+READ_COUNT = 10
+
+
+async def _ensure_group() -> None:
+    stream = get_redis()
+    try:
+        await stream.xgroup_create(
+            QUEUE_NAME,
+            CONSUMER_GROUP,
+            id="0",
+            mkstream=True,
+        )
+    except redis.exceptions.ResponseError as exc:
+        # BUSYGROUP means the group already exists; anything else
+        # (e.g. WRONGTYPE on a mis-typed stream key) is a real error.
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+
+async def run_worker() -> None:
+    """
+    Consume jobs from the stream until the process is stopped.
+    """
+    await _ensure_group()
+    stream = get_redis()
+
+    logger.info(
+        "Worker %s consuming stream %s", CONSUMER_NAME, QUEUE_NAME
+    )
+
+    try:
+        while True:
+            entries = await stream.xreadgroup(
+                CONSUMER_GROUP,
+                CONSUMER_NAME,
+                {QUEUE_NAME: ">"},
+                count=READ_COUNT,
+                block=BLOCK_MS,
+            )
+
+            for _stream, messages in entries:
+                for message_id, fields in messages:
+                    job_id = fields[b"job_id"].decode()
+
+                    try:
+                        await consume(job_id)
+                    except Exception:
+                        # consume() marks the job FAILED itself; an
+                        # exception here means something outside job
+                        # processing broke. Ack anyway so the message
+                        # is not redelivered forever.
+                        logger.exception(
+                            "Unhandled error processing job %s", job_id
+                        )
+
+                    await stream.xack(
+                        QUEUE_NAME, CONSUMER_GROUP, message_id
+                    )
+    finally:
+        await close_claude_service()
+        await close_http_client()
+        await close_redis()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,11 @@ of analyzed content using Claude AI.
 This service is called only after moderation results are available.
 """
 
-from typing import Dict
+import asyncio
+from typing import Dict, Optional
 
 import httpx
+import orjson
 
 from app.config import (
     CLAUDE_API_KEY,
@@ -18,6 +20,12 @@ from app.config import (
     USE_FAKE_AI,
 )
 
+# Serialized moderation results are truncated to this many characters
+# in the prompt; plenty for the summary, bounded for token cost and
+# event-loop time on big jobs.
+MAX_PROMPT_RESULTS_CHARS = 8000
+
+
 class ClaudeSummaryService:
     """
     Thin async wrapper around Claude AI for content summarization.
@@ -43,7 +51,11 @@ class ClaudeSummaryService:
                 "Manual review is recommended."
             )
 
-        prompt = self._build_prompt(analysis_results)
+        # Serializing a large results dict is CPU work; run it in a
+        # thread so the event loop stays free for concurrent jobs.
+        prompt = await asyncio.to_thread(
+            self._build_prompt, analysis_results
+        )
 
         response = await self._client.post(
             CLAUDE_API_URL,
@@ -52,20 +64,24 @@ class ClaudeSummaryService:
                 "anthropic-version": "2023-06-01",
                 "content-type": "application/json",
             },
-            json={
-                "model": CLAUDE_MODEL,
-                "max_tokens": 200,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-            },
+            # Encode the body with orjson instead of httpx's stdlib
+            # json path; the content-type header is already set above.
+            content=orjson.dumps(
+                {
+                    "model": CLAUDE_MODEL,
+                    "max_tokens": 200,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        }
+                    ],
+                }
+            ),
         )
 
         response.raise_for_status()
-        payload = response.json()
+        payload = orjson.loads(response.content)
 
         return payload["content"][0]["text"].strip()
 
@@ -77,6 +93,12 @@ class ClaudeSummaryService:
         visual = analysis_results.get("visual", {})
         overall = visual.get("overall_visual_score")
 
+        # orjson beats the dict repr the f-string would produce, and
+        # truncation bounds prompt size for jobs with many media.
+        results_json = orjson.dumps(analysis_results).decode()[
+            :MAX_PROMPT_RESULTS_CHARS
+        ]
+
         return f"""
 You are an AI content safety assistant.
 
@@ -89,10 +111,40 @@ Requirements:
 - Clearly state whether the content appears safe for campaign use
 
 Moderation results:
-{analysis_results}
+{results_json}
 
 Overall visual safety score: {overall}
 """
 
     async def close(self) -> None:
         await self._client.aclose()
+
+
+# -------------------------------------------------------------------
+# Process-wide service instance
+# -------------------------------------------------------------------
+
+_claude_service: Optional[ClaudeSummaryService] = None
+
+
+def get_claude_service() -> ClaudeSummaryService:
+    """
+    Return the shared ClaudeSummaryService, creating it on first use.
+    """
+    global _claude_service
+
+    if _claude_service is None:
+        _claude_service = ClaudeSummaryService()
+
+    return _claude_service
+
+
+async def close_claude_service() -> None:
+    """
+    Close the shared service's HTTP client on application shutdown.
+    """
+    global _claude_service
+
+    if _claude_service is not None:
+        await _claude_service.close()
+    _claude_service = None
@@ -12,10 +12,16 @@ This client is intentionally thin.
 Business logic (scoring, thresholds, aggregation) lives elsewhere.
 """
 
-from typing import Dict, Any
+import asyncio
+import hashlib
+from typing import Dict, Any, List, Optional
 
 import httpx
+import orjson
+import redis.exceptions
+import tenacity
 
+from app.cache.redis import get_redis
 from app.config import (
     SIGHTENGINE_API_USER,
     SIGHTENGINE_API_SECRET,
@@ -24,6 +30,88 @@ from app.config import (
 )
 
 
+# -------------------------------------------------------------------
+# Shared HTTP connection pool
+# -------------------------------------------------------------------
+#
+# A single process-wide AsyncClient keeps TCP+TLS connections warm
+# across jobs and multiplexes concurrent requests over HTTP/2,
+# instead of paying a fresh handshake per client instance.
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_lock = asyncio.Lock()
+
+# Fresh cache entries short-circuit the API call entirely; stale
+# entries are kept longer and served only when Sightengine fails.
+CACHE_TTL = 3600
+CACHE_STALE_TTL = 86400
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared httpx client, creating it on first use.
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        async with _http_client_lock:
+            if _http_client is None or _http_client.is_closed:
+                _http_client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=SIGHTENGINE_TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=50,
+                    ),
+                )
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared httpx client on application shutdown.
+    """
+    global _http_client
+
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+# -------------------------------------------------------------------
+# Response cache helpers
+# -------------------------------------------------------------------
+#
+# Cache failures are soft: a broken or absent Redis must never block
+# moderation, so every cache operation degrades to a direct API call.
+
+def _cache_key(image_url: str) -> str:
+    return f"se:{hashlib.sha256(image_url.encode()).hexdigest()}"
+
+
+async def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        cached = await get_redis().get(key)
+    except (redis.exceptions.RedisError, OSError):
+        return None
+
+    if cached is None:
+        return None
+
+    return orjson.loads(cached)
+
+
+async def _cache_store(key: str, payload: Dict[str, Any]) -> None:
+    blob = orjson.dumps(payload)
+    try:
+        cache = get_redis()
+        await cache.set(key, blob, ex=CACHE_TTL)
+        await cache.set(f"{key}:stale", blob, ex=CACHE_STALE_TTL)
+    except (redis.exceptions.RedisError, OSError):
+        pass
+
+
 class SightengineError(Exception):
     """
     Raised when Sightengine API returns an error response
@@ -32,6 +120,101 @@ class SightengineError(Exception):
     pass
 
 
+class _RetryableStatusError(SightengineError):
+    """
+    Raised internally for HTTP statuses worth retrying (rate limits
+    and upstream 5xx). Escapes only once all attempts are exhausted.
+
+    Carries the parsed Retry-After value (seconds) for 429 responses
+    so the wait strategy can honor it.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Transient blips should not drop a media item's categories: retry
+# network errors and retryable statuses a few times with jittered
+# exponential backoff before giving up.
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Upper bound honored from a Retry-After header, in seconds.
+_MAX_RETRY_AFTER = 30.0
+
+_BACKOFF_WAIT = tenacity.wait_exponential_jitter(initial=0.1, max=2)
+
+
+def _wait_retry_after(
+    retry_state: tenacity.RetryCallState,
+) -> float:
+    """
+    Wait strategy honoring Retry-After when the server provided one,
+    falling back to jittered exponential backoff. Runs only between
+    attempts, so an exhausted final attempt never sleeps.
+    """
+    outcome = retry_state.outcome
+    if outcome is not None and outcome.failed:
+        exc = outcome.exception()
+        if (
+            isinstance(exc, _RetryableStatusError)
+            and exc.retry_after is not None
+        ):
+            return min(exc.retry_after, _MAX_RETRY_AFTER)
+
+    return _BACKOFF_WAIT(retry_state)
+
+
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(3),
+    wait=_wait_retry_after,
+    retry=tenacity.retry_if_exception_type(
+        (httpx.TransportError, _RetryableStatusError)
+    ),
+    reraise=True,
+)
+async def _send(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Issue one HTTP request, raising _RetryableStatusError on
+    transient statuses so tenacity retries it.
+
+    The request is sent in streaming mode: the body is read exactly
+    once into bytes (for orjson to parse directly), and error bodies
+    on retryable statuses are never downloaded at all.
+    """
+    client = await get_http_client()
+    request = client.build_request(method, url, **kwargs)
+    response = await client.send(request, stream=True)
+
+    if response.status_code in _RETRYABLE_STATUS_CODES:
+        await response.aclose()
+
+        retry_after = None
+        if response.status_code == 429:
+            header = response.headers.get("Retry-After")
+            if header:
+                try:
+                    retry_after = float(header)
+                except ValueError:
+                    pass
+
+        raise _RetryableStatusError(
+            f"Sightengine returned HTTP {response.status_code}",
+            retry_after=retry_after,
+        )
+
+    try:
+        await response.aread()
+    finally:
+        await response.aclose()
+
+    return response
+
+
 class SightengineClient:
     """
     Async client for Sightengine content moderation API.
@@ -41,20 +224,17 @@ class SightengineClient:
 
     BASE_URL = "https://api.sightengine.com/1.0/check.json"
 
+    MODELS = "nudity,weapon,violence,medical,spoof"
+
     def __init__(self) -> None:
         if USE_FAKE_AI:
-            self.session = None
             return
-        
+
         if not SIGHTENGINE_API_USER or not SIGHTENGINE_API_SECRET:
             raise RuntimeError(
                 "Sightengine credentials are not configured"
             )
 
-        self._client = httpx.AsyncClient(
-            timeout=SIGHTENGINE_TIMEOUT,
-        )
-
     async def analyze_image(self, image_url: str) -> Dict[str, Any]:
         """
         Analyze a single image URL using Sightengine.
@@ -74,26 +254,47 @@ class SightengineClient:
         SightengineError
             If the API returns an error or the request fails.
         """
-        
+
         if USE_FAKE_AI:
-            return {
-                "status": "success",
-                "nudity": {"sexual_activity": 0.01},
-                "violence": {"violence": 0.02},
-                "weapon": {"firearm": 0.0},
-                "medical": {"gore": 0.0},
-                "spoof": {"fake": 0.15},
-            }
+            return self._fake_payload()
+
+        # Identical URLs frequently recur across posts and campaigns;
+        # a fresh cache hit avoids the API round-trip and its cost.
+        cache_key = _cache_key(image_url)
+
+        cached = await _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            payload = await self._fetch_image(image_url)
+        except SightengineError:
+            # Stale-while-revalidate fallback: a previously good
+            # result beats failing the media item outright.
+            stale = await _cache_get(f"{cache_key}:stale")
+            if stale is not None:
+                return stale
+            raise
+
+        await _cache_store(cache_key, payload)
+
+        return payload
+
+    async def _fetch_image(self, image_url: str) -> Dict[str, Any]:
+        """
+        Perform the actual single-URL Sightengine API call.
+        """
 
         params = {
             "url": image_url,
-            "models": "nudity,weapon,violence,medical,spoof",
+            "models": self.MODELS,
             "api_user": SIGHTENGINE_API_USER,
             "api_secret": SIGHTENGINE_API_SECRET,
         }
 
         try:
-            response = await self._client.get(
+            response = await _send(
+                "GET",
                 self.BASE_URL,
                 params=params,
             )
@@ -107,7 +308,9 @@ class SightengineClient:
                 f"Sightengine returned HTTP {response.status_code}"
             )
 
-        payload = response.json()
+        # orjson is several times faster than httpx's stdlib-json path
+        # and parses the raw bytes without an intermediate str decode.
+        payload = orjson.loads(response.content)
 
         if payload.get("status") != "success":
             raise SightengineError(
@@ -116,8 +319,169 @@ class SightengineClient:
 
         return payload
 
+    async def analyze_images(self, image_urls: List[str]) -> List[Any]:
+        """
+        Analyze multiple image URLs in a single Sightengine round-trip.
+
+        Sightengine accepts a comma-separated ``url`` parameter and
+        returns one result object per URL, so a batch of N images costs
+        one HTTP request instead of N.
+
+        Parameters
+        ----------
+        image_urls : list of str
+            Publicly accessible image URLs.
+
+        Returns
+        -------
+        list
+            One entry per input URL, in order: the raw Sightengine
+            payload dict, or a SightengineError instance for URLs
+            whose check failed. Per-URL failures never fail the
+            healthy URLs in the same batch.
+
+        Raises
+        ------
+        SightengineError
+            If the whole request fails (network error, non-200,
+            unparseable response).
+        """
+
+        if not image_urls:
+            return []
+
+        if USE_FAKE_AI:
+            return [self._fake_payload() for _ in image_urls]
+
+        results: Dict[str, Any] = {}
+        misses: List[str] = []
+
+        # Identical URLs recur across posts and campaigns; serve
+        # fresh cache hits and send only the misses to Sightengine.
+        for url in image_urls:
+            cached = await _cache_get(_cache_key(url))
+            if cached is not None:
+                results[url] = cached
+            else:
+                misses.append(url)
+
+        if misses:
+            try:
+                fetched = await self._fetch_images(misses)
+            except SightengineError as exc:
+                # Whole-request failure: every miss shares the error,
+                # subject to the per-URL stale fallback below.
+                fetched = [exc] * len(misses)
+
+            for url, item in zip(misses, fetched):
+                if isinstance(item, SightengineError):
+                    # Stale-while-revalidate fallback, as in the
+                    # single-URL path.
+                    stale = await _cache_get(f"{_cache_key(url)}:stale")
+                    results[url] = stale if stale is not None else item
+                else:
+                    await _cache_store(_cache_key(url), item)
+                    results[url] = item
+
+        return [results[url] for url in image_urls]
+
+    async def _fetch_images(self, image_urls: List[str]) -> List[Any]:
+        """
+        Perform the actual multi-URL Sightengine API call.
+
+        Returns payload dicts or per-item SightengineError entries,
+        aligned to input order; raises only on request-level failures.
+        """
+
+        # A batch of one gains nothing from the multi-URL form.
+        if len(image_urls) == 1:
+            return [await self._fetch_image(image_urls[0])]
+
+        params = {
+            "url": ",".join(image_urls),
+            "models": self.MODELS,
+            "api_user": SIGHTENGINE_API_USER,
+            "api_secret": SIGHTENGINE_API_SECRET,
+        }
+
+        try:
+            response = await _send(
+                "POST",
+                self.BASE_URL,
+                data=params,
+            )
+        except httpx.RequestError as exc:
+            raise SightengineError(
+                f"Network error while calling Sightengine: {exc}"
+            ) from exc
+
+        if response.status_code != 200:
+            raise SightengineError(
+                f"Sightengine returned HTTP {response.status_code}"
+            )
+
+        payload = orjson.loads(response.content)
+
+        # Multi-URL checks come back as a list of per-URL objects,
+        # either at the top level or under "data".
+        if isinstance(payload, list):
+            results = payload
+        elif isinstance(payload, dict):
+            results = payload.get("data")
+        else:
+            results = None
+
+        if not isinstance(results, list) or len(results) != len(image_urls):
+            raise SightengineError(
+                f"Unexpected batch response from Sightengine: {payload}"
+            )
+
+        # A failed check for one URL (e.g. a dead link) must not fail
+        # its batch mates; surface it as a per-item error instead.
+        return [
+            item
+            if item.get("status") == "success"
+            else SightengineError(f"Sightengine API error: {item}")
+            for item in results
+        ]
+
+    @staticmethod
+    def _fake_payload() -> Dict[str, Any]:
+        """
+        Deterministic payload returned in USE_FAKE_AI mode.
+        """
+        return {
+            "status": "success",
+            "nudity": {"sexual_activity": 0.01},
+            "violence": {"violence": 0.02},
+            "weapon": {"firearm": 0.0},
+            "medical": {"gore": 0.0},
+            "spoof": {"fake": 0.15},
+        }
+
     async def close(self) -> None:
         """
-        Gracefully close the underlying HTTP client.
+        Gracefully close the shared HTTP client.
+
+        Intended to be called once on application shutdown, not per job.
         """
-        await self._client.aclose()
+        await close_http_client()
+
+
+# -------------------------------------------------------------------
+# Process-wide client instance
+# -------------------------------------------------------------------
+
+_sightengine_client: Optional[SightengineClient] = None
+
+
+def get_sightengine_client() -> SightengineClient:
+    """
+    Return the shared SightengineClient, creating it on first use.
+    """
+    global _sightengine_client
+
+    if _sightengine_client is None:
+        _sightengine_client = SightengineClient()
+
+    return _sightengine_client
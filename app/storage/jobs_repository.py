@@ -3,32 +3,97 @@ jobs_repository.py
 
 Persistence abstraction for content analysis jobs.
 
-This repository intentionally hides the underlying storage
-(DynamoDB, Postgres, etc.) behind a minimal async interface.
+Jobs are stored as Redis hashes (``job:{job_id}``), so any number of
+API and worker processes share the same view of job state and jobs
+survive process restarts. Status changes are additionally published
+on a ``job:{job_id}`` channel so interested consumers (e.g. a
+long-polling status endpoint) can subscribe instead of polling.
 """
 
 from typing import Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
+import orjson
 
-class JobsRepository:
+from app.cache.redis import get_redis
+
+# Fields stored as JSON blobs inside the hash.
+_JSON_FIELDS = ("payload", "results", "errors")
+
+# Fields stored as ISO-8601 strings.
+_DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+def _job_key(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+def status_cache_key(job_id: str) -> str:
     """
-    Async repository for job persistence.
+    Key of the cached status-endpoint response for a job.
 
-    NOTE:
-    This is a simplified example. In production, this would be backed
-    by DynamoDB, Aurora, or another durable store.
+    Owned here so every write path can invalidate it.
     """
+    return f"jobstatus:{job_id}"
 
-    _STORE: Dict[str, Dict] = {}
+
+def _serialize(job: Dict) -> Dict[str, bytes]:
+    """
+    Flatten a job dict into Redis hash fields.
+    """
+    mapping: Dict[str, bytes] = {}
+
+    for field, value in job.items():
+        if field in _JSON_FIELDS:
+            mapping[field] = orjson.dumps(value)
+        elif isinstance(value, datetime):
+            mapping[field] = value.isoformat().encode()
+        else:
+            mapping[field] = str(value).encode()
+
+    return mapping
+
+
+def _deserialize(data: Dict[bytes, bytes]) -> Dict:
+    """
+    Rebuild a job dict from Redis hash fields.
+    """
+    job: Dict = {}
+
+    for raw_field, raw_value in data.items():
+        field = raw_field.decode()
+
+        if field in _JSON_FIELDS:
+            job[field] = orjson.loads(raw_value)
+        elif field in _DATETIME_FIELDS:
+            job[field] = datetime.fromisoformat(raw_value.decode())
+        else:
+            job[field] = raw_value.decode()
+
+    return job
+
+
+class JobsRepository:
+    """
+    Async repository for job persistence backed by Redis hashes.
+    """
 
     @classmethod
     async def create(cls, job: Dict) -> None:
-        cls._STORE[job["job_id"]] = job
+        redis = get_redis()
+        await redis.hset(
+            _job_key(job["job_id"]),
+            mapping=_serialize(job),
+        )
 
     @classmethod
     async def get(cls, job_id: str) -> Optional[Dict]:
-        return cls._STORE.get(job_id)
+        redis = get_redis()
+        data = await redis.hgetall(_job_key(job_id))
+        if not data:
+            return None
+
+        return _deserialize(data)
 
     @classmethod
     async def update_status(
@@ -36,16 +101,33 @@ class JobsRepository:
         job_id: str,
         status: str,
         error: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> None:
-        job = cls._STORE.get(job_id)
-        if not job:
+        redis = get_redis()
+        key = _job_key(job_id)
+
+        if not await redis.exists(key):
             return
 
-        job["status"] = status
-        job["updated_at"] = datetime.utcnow()
+        # Callers that already hold a timestamp pass it down instead
+        # of paying another datetime.now() per update.
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        update: Dict = {
+            "status": status,
+            "updated_at": now,
+        }
 
         if error:
-            job.setdefault("errors", []).append(error)
+            raw_errors = await redis.hget(key, "errors")
+            errors = orjson.loads(raw_errors) if raw_errors else []
+            errors.append(error)
+            update["errors"] = errors
+
+        await redis.hset(key, mapping=_serialize(update))
+        await redis.delete(status_cache_key(job_id))
+        await redis.publish(key, status)
 
     @classmethod
     async def update_results(
@@ -55,10 +137,21 @@ class JobsRepository:
         status: str,
         updated_at: datetime,
     ) -> None:
-        job = cls._STORE.get(job_id)
-        if not job:
+        redis = get_redis()
+        key = _job_key(job_id)
+
+        if not await redis.exists(key):
             return
 
-        job["results"] = results
-        job["status"] = status
-        job["updated_at"] = updated_at
+        await redis.hset(
+            key,
+            mapping=_serialize(
+                {
+                    "results": results,
+                    "status": status,
+                    "updated_at": updated_at,
+                }
+            ),
+        )
+        await redis.delete(status_cache_key(job_id))
+        await redis.publish(key, status)
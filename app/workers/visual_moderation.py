@@ -14,12 +14,20 @@ Responsibilities:
 This worker is designed to be idempotent and fault-tolerant.
 """
 
-from typing import Dict, List, Any
-from statistics import mean
-from datetime import datetime
-
-from app.services.sightengine_client import SightengineClient, SightengineError
-from app.services.claude_summary_service import ClaudeSummaryService
+import asyncio
+import operator
+import os
+import warnings
+from typing import Dict, List, Any, Optional
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.services.sightengine_client import (
+    SightengineError,
+    get_sightengine_client,
+)
+from app.services.claude_summary_service import get_claude_service
 from app.models.schemas import (
     MediaModerationResult,
     CategoryResult,
@@ -43,6 +51,31 @@ VISUAL_CATEGORIES = {
 SAFE_THRESHOLD = 90.0
 WARNING_THRESHOLD = 70.0
 
+# Category order frozen once so scores can live in a fixed-width
+# numeric array during aggregation.
+CATEGORY_NAMES = list(VISUAL_CATEGORIES.keys())
+_CATEGORY_INDEX = {
+    category: index
+    for index, category in enumerate(CATEGORY_NAMES)
+}
+
+# The mapping is also frozen as a tuple for hot-loop iteration, and an
+# itemgetter pulls all model sub-dicts out of a payload in one call
+# instead of five .get() lookups per media item.
+_CATEGORY_MODELS = tuple(VISUAL_CATEGORIES.items())
+_MODEL_GETTER = operator.itemgetter(*VISUAL_CATEGORIES.values())
+
+# Maximum number of in-flight Sightengine requests per job.
+SIGHTENGINE_CONCURRENCY = int(os.getenv("SE_CONCURRENCY", "16"))
+
+# Number of image URLs sent per Sightengine request.
+SIGHTENGINE_BATCH_SIZE = int(os.getenv("SE_BATCH_SIZE", "10"))
+
+# Once this many media items come back with an Unsafe category, the
+# job is failed immediately: outstanding Sightengine calls are
+# cancelled and the Claude summary is skipped.
+UNSAFE_SHORT_CIRCUIT_COUNT = int(os.getenv("UNSAFE_SHORT_CIRCUIT_COUNT", "1"))
+
 
 # -------------------------------------------------------------------
 # Scoring & status logic
@@ -59,66 +92,117 @@ def safety_status(score: float) -> str:
     return "Unsafe"
 
 
-def extract_category_score(payload: Dict[str, Any], model: str) -> float:
+def score_from_model_data(model_data: Dict[str, float]) -> float:
     """
-    Extract a safety score for a given Sightengine model.
+    Convert one Sightengine model sub-dict into a safety score.
 
     Sightengine returns probabilities of *presence*.
     We convert them into *safety* percentages.
     """
+    # Highest risk probability defines the category risk.
+    # Manual scan instead of max(): skips an iterator allocation plus
+    # builtin call per category and early-exits once risk is certain.
+    risk_probability = 0.0
+    for value in model_data.values():
+        if value > risk_probability:
+            risk_probability = value
+            if risk_probability >= 1.0:
+                break
+
+    safety_score = (1.0 - risk_probability) * 100.0
+
+    return round(safety_score, 2)
+
+
+def extract_category_score(payload: Dict[str, Any], model: str) -> float:
+    """
+    Extract a safety score for a given Sightengine model.
+    """
     model_data = payload.get(model, {})
     if not model_data:
         raise KeyError(f"Missing model data: {model}")
 
-    # Highest risk probability defines the category risk
-    risk_probability = max(model_data.values())
-    safety_score = (1.0 - risk_probability) * 100
+    return score_from_model_data(model_data)
 
-    return round(safety_score, 2)
+
+def payload_is_unsafe(payload: Dict[str, Any]) -> bool:
+    """
+    Check whether any category in a Sightengine payload scores Unsafe.
+    """
+    for _, model in _CATEGORY_MODELS:
+        model_data = payload.get(model)
+        if not model_data:
+            continue
+
+        if safety_status(score_from_model_data(model_data)) == "Unsafe":
+            return True
+
+    return False
 
 
 # -------------------------------------------------------------------
 # Media processing
 # -------------------------------------------------------------------
 
-async def process_media_item(
-    client: SightengineClient,
+def build_media_result(
     media: Dict[str, Any],
+    payload: Optional[Dict[str, Any]],
+    error: Optional[str] = None,
 ) -> MediaModerationResult:
     """
-    Analyze a single media item and return moderation results.
+    Parse a raw Sightengine payload into moderation results
+    for a single media item.
 
     Errors are captured per media item and do not fail the job.
     """
 
-    categories: Dict[str, CategoryResult] = {}
+    categories: Dict[str, Dict[str, Any]] = {}
     errors: List[str] = []
 
-    try:
-        payload = await client.analyze_image(media["url"])
+    if error is not None:
+        errors.append(error)
+    elif payload is not None:
+        try:
+            # Fast path: pull every model sub-dict in one C-level call.
+            model_payloads = _MODEL_GETTER(payload)
+        except KeyError:
+            # One or more models missing; fall back to per-model .get().
+            model_payloads = tuple(
+                payload.get(model, {})
+                for _, model in _CATEGORY_MODELS
+            )
 
-        for category, model in VISUAL_CATEGORIES.items():
+        for (category, model), model_data in zip(
+            _CATEGORY_MODELS, model_payloads
+        ):
             try:
-                score = extract_category_score(payload, model)
-                categories[category] = CategoryResult(
-                    score=score,
-                    status=safety_status(score),
-                )
+                if not model_data:
+                    raise KeyError(f"Missing model data: {model}")
+
+                score = score_from_model_data(model_data)
+                categories[category] = {
+                    "score": score,
+                    "status": safety_status(score),
+                }
             except Exception as exc:
-                categories[category] = CategoryResult(
-                    score=None,
-                    status=None,
-                )
+                categories[category] = {
+                    "score": None,
+                    "status": None,
+                }
                 errors.append(
                     f"{category}: {str(exc)}"
                 )
 
-    except SightengineError as exc:
-        errors.append(str(exc))
-
-    return MediaModerationResult(
+    # Scores and statuses are produced internally from already-parsed
+    # payloads, so validation is intentionally skipped: the hot loop
+    # assembles plain dicts and the models are built once per media
+    # item with model_construct.
+    return MediaModerationResult.model_construct(
         media_id=media["media_id"],
-        categories=categories,
+        categories={
+            category: CategoryResult.model_construct(**data)
+            for category, data in categories.items()
+        },
         errors=errors,
     )
 
@@ -132,30 +216,42 @@ def aggregate_visual_results(
 ) -> VisualSafetyReport:
     """
     Aggregate visual moderation results across all media items.
+
+    Scores are packed into a single (n_media, n_categories) array with
+    NaN marking missing values, so the per-category and overall means
+    run in NumPy's C kernels instead of nested Python loops.
     """
 
-    aggregated: Dict[str, List[float]] = {
-        category: []
-        for category in VISUAL_CATEGORIES.keys()
-    }
+    scores = np.full(
+        (len(media_results), len(CATEGORY_NAMES)),
+        np.nan,
+        dtype=np.float32,
+    )
 
-    for media in media_results:
+    for row, media in enumerate(media_results):
         for category, result in media.categories.items():
             if result.score is not None:
-                aggregated[category].append(result.score)
+                scores[row, _CATEGORY_INDEX[category]] = result.score
+
+    with warnings.catch_warnings():
+        # All-NaN columns (no valid data) are expected; they surface
+        # as NaN means rather than as RuntimeWarnings.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        category_means = np.nanmean(scores, axis=0)
+        overall_mean = np.nanmean(category_means)
 
     final_categories: Dict[str, CategoryResult] = {}
 
-    for category, scores in aggregated.items():
-        if not scores:
-            final_categories[category] = CategoryResult(
+    for index, category in enumerate(CATEGORY_NAMES):
+        if np.isnan(category_means[index]):
+            final_categories[category] = CategoryResult.model_construct(
                 score=None,
                 status=None,
                 explanation="No valid data available",
             )
             continue
 
-        avg_score = round(mean(scores), 2)
+        avg_score = round(float(category_means[index]), 2)
         status = safety_status(avg_score)
 
         explanation = None
@@ -165,25 +261,20 @@ def aggregate_visual_results(
                 "Manual review recommended."
             )
 
-        final_categories[category] = CategoryResult(
+        final_categories[category] = CategoryResult.model_construct(
             score=avg_score,
             status=status,
             explanation=explanation,
         )
 
-    overall_scores = [
-        result.score
-        for result in final_categories.values()
-        if result.score is not None
-    ]
-
     overall_visual_score = (
-        round(mean(overall_scores), 2)
-        if overall_scores
+        round(float(overall_mean), 2)
+        if not np.isnan(overall_mean)
         else None
     )
 
-    return VisualSafetyReport(
+    # Internal trusted data: skip validation here as well.
+    return VisualSafetyReport.model_construct(
         categories=final_categories,
         overall_visual_score=overall_visual_score,
     )
@@ -206,23 +297,112 @@ async def process_visual_moderation_job(
         status="IN_PROGRESS",
     )
 
-    client = None
-    claude = None
+    # Both clients are process-wide singletons created once and closed
+    # on application shutdown, not per job.
+    client = get_sightengine_client()
+    claude = get_claude_service()
 
-    client = SightengineClient()
     media_results: List[MediaModerationResult] = []
 
     try:
-        for post in payload["posts"]:
-            for media in post["media"]:
-                if media["type"] != "image":
-                    continue  # video frames handled elsewhere
+        images = [
+            media
+            for post in payload["posts"]
+            for media in post["media"]
+            if media["type"] == "image"  # video frames handled elsewhere
+        ]
+
+        # Creators frequently reuse the same asset across posts;
+        # analyze each distinct URL once and fan the payload back to
+        # every media item sharing it.
+        unique_urls = list(
+            dict.fromkeys(media["url"] for media in images)
+        )
 
-                result = await process_media_item(client, media)
-                media_results.append(result)
+        # Group unique URLs into multi-URL Sightengine requests, so a
+        # batch of N images costs one round-trip instead of N, and fan
+        # the batches out concurrently. Errors are captured per batch
+        # and mapped back to media items, so gather never
+        # short-circuits the job.
+        batches = [
+            unique_urls[i:i + SIGHTENGINE_BATCH_SIZE]
+            for i in range(0, len(unique_urls), SIGHTENGINE_BATCH_SIZE)
+        ]
+
+        semaphore = asyncio.Semaphore(SIGHTENGINE_CONCURRENCY)
+
+        async def analyze_batch(
+            batch: List[str],
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    payloads = await client.analyze_images(batch)
+                except SightengineError as exc:
+                    return {url: exc for url in batch}
+
+            return dict(zip(batch, payloads))
+
+        payload_by_url: Dict[str, Any] = {}
+        unsafe_count = 0
+        short_circuited = False
+
+        tasks = [
+            asyncio.create_task(analyze_batch(batch))
+            for batch in batches
+        ]
+
+        # Consume batches as they finish so a clearly failing job can
+        # stop early: once enough media come back Unsafe, cancel the
+        # outstanding Sightengine calls instead of paying for them.
+        for future in asyncio.as_completed(tasks):
+            batch_payloads = await future
+            payload_by_url.update(batch_payloads)
+
+            for batch_payload in batch_payloads.values():
+                if isinstance(batch_payload, SightengineError):
+                    continue
+                if payload_is_unsafe(batch_payload):
+                    unsafe_count += 1
+
+            if unsafe_count >= UNSAFE_SHORT_CIRCUIT_COUNT:
+                short_circuited = True
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                break
+
+        for media in images:
+            payload = payload_by_url.get(media["url"])
+            if payload is None:
+                # Analysis cancelled by the short-circuit.
+                continue
+            if isinstance(payload, SightengineError):
+                media_results.append(
+                    build_media_result(media, None, error=str(payload))
+                )
+            else:
+                media_results.append(
+                    build_media_result(media, payload)
+                )
 
         visual_report = aggregate_visual_results(media_results)
 
+        if short_circuited:
+            # The job already failed on hard Unsafe signals; skip the
+            # Claude summary and remaining analysis entirely. Tradeoff:
+            # early-failed jobs carry no summary and only the media
+            # analyzed before the cut-off.
+            await JobsRepository.update_results(
+                job_id,
+                results={
+                    "visual": visual_report.model_dump(),
+                    "media": [r.model_dump() for r in media_results],
+                },
+                status="FAILED",
+                updated_at=datetime.now(timezone.utc),
+            )
+            return
+
         statuses = [r.status for r in visual_report.categories.values()]
 
         if "Unsafe" in statuses:
@@ -232,23 +412,36 @@ async def process_visual_moderation_job(
         else:
             job_status = "COMPLETED"
 
-        claude = ClaudeSummaryService()
+        results = {
+            "visual": visual_report.model_dump(),
+            "media": [r.model_dump() for r in media_results],
+        }
+
+        # Kick off the Claude summary and persist the preliminary
+        # results concurrently, so pollers see partial data while the
+        # LLM call (~1-3s) is still in flight.
+        summary_task = asyncio.create_task(
+            claude.generate_summary(
+                analysis_results={
+                    "visual": results["visual"],
+                }
+            )
+        )
 
-        summary = await claude.generate_summary(
-            analysis_results={
-                "visual": visual_report.model_dump()
-            }
+        await JobsRepository.update_results(
+            job_id,
+            results=results,
+            status="IN_PROGRESS",
+            updated_at=datetime.now(timezone.utc),
         )
 
+        results["summary"] = await summary_task
+
         await JobsRepository.update_results(
             job_id,
-            results={
-                "visual": visual_report.model_dump(),
-                "media": [r.model_dump() for r in media_results],
-                "summary": summary,
-            },
+            results=results,
             status=job_status,
-            updated_at=datetime.utcnow(),
+            updated_at=datetime.now(timezone.utc),
         )
 
     except Exception as exc:
@@ -258,9 +451,3 @@ async def process_visual_moderation_job(
             status="FAILED",
             error=str(exc),
         )
-
-    finally:
-        if client:
-            await client.close()
-        if claude:
-            await claude.close()